@@ -35,6 +35,8 @@ class InvalidUpdateError(Exception):
 
 
 class BaseChannel(Generic[Value, Update, C], ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def ValueType(self) -> Any:
@@ -16,6 +16,8 @@ class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
     ```
     """
 
+    __slots__ = ("typ", "operator", "value")
+
     def __init__(self, typ: Type[Value], operator: Callable[[Value, Value], Value]):
         self.typ = typ
         self.operator = operator
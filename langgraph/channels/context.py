@@ -37,6 +37,8 @@ class Context(Generic[Value], BaseChannel[Value, None, None]):
 
     value: Value
 
+    __slots__ = ("typ", "ctx", "actx", "value")
+
     def __init__(
         self,
         ctx: Optional[Callable[[], ContextManager[Value]]] = None,
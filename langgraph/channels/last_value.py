@@ -14,6 +14,8 @@ from langgraph.channels.base import (
 class LastValue(Generic[Value], BaseChannel[Value, Value, Value]):
     """Stores the last value received, can receive at most one value per step."""
 
+    __slots__ = ("typ", "value")
+
     def __init__(self, typ: Type[Value]) -> None:
         self.typ = typ
 
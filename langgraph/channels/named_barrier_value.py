@@ -14,6 +14,8 @@ from langgraph.channels.base import (
 class NamedBarrierValue(Generic[Value], BaseChannel[Value, Value, set[Value]]):
     """A channel that waits until all named values are received before making the value available."""
 
+    __slots__ = ("typ", "names", "seen")
+
     def __init__(self, typ: Type[Value], names: set[Value]) -> None:
         self.typ = typ
         self.names = names
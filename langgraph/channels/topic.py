@@ -28,6 +28,8 @@ class Topic(
         accumulate: Whether to accummulate values across steps. If False, the channel will be emptied after each step.
     """
 
+    __slots__ = ("typ", "unique", "accumulate", "seen", "values")
+
     def __init__(
         self, typ: Type[Value], unique: bool = False, accumulate: bool = False
     ) -> None:
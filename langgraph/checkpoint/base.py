@@ -1,7 +1,6 @@
 import asyncio
 from abc import ABC
 from collections import defaultdict
-from copy import deepcopy
 from datetime import datetime, timezone
 from typing import Any, AsyncIterator, Iterator, NamedTuple, Optional, TypedDict
 
@@ -59,7 +58,10 @@ def copy_checkpoint(checkpoint: Checkpoint) -> Checkpoint:
         ts=checkpoint["ts"],
         channel_values=checkpoint["channel_values"].copy(),
         channel_versions=checkpoint["channel_versions"].copy(),
-        versions_seen=deepcopy(checkpoint["versions_seen"]),
+        versions_seen=defaultdict(
+            _seen_dict,
+            {k: v.copy() for k, v in checkpoint["versions_seen"].items()},
+        ),
     )
 
 
@@ -93,6 +95,9 @@ CheckpointThreadTs = ConfigurableFieldSpec(
 )
 
 
+_DONE = object()
+
+
 class BaseCheckpointSaver(Serializable, ABC):
     at: CheckpointAt = CheckpointAt.END_OF_RUN
 
@@ -124,12 +129,14 @@ class BaseCheckpointSaver(Serializable, ABC):
 
     async def alist(self, config: RunnableConfig) -> AsyncIterator[CheckpointTuple]:
         loop = asyncio.get_running_loop()
-        iter = loop.run_in_executor(None, self.list, config)
+        iter = await loop.run_in_executor(None, self.list, config)
         while True:
-            try:
-                yield await loop.run_in_executor(None, next, iter)
-            except StopIteration:
+            # StopIteration can't be raised into a Future,
+            # so signal the end of the iterator with a sentinel value instead
+            value = await loop.run_in_executor(None, next, iter, _DONE)
+            if value is _DONE:
                 return
+            yield value
 
     async def aput(
         self, config: RunnableConfig, checkpoint: Checkpoint
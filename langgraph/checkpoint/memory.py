@@ -45,3 +45,12 @@ class MemorySaver(BaseCheckpointSaver):
                 "thread_ts": checkpoint["ts"],
             }
         }
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        # in-memory lookups don't block, so skip the thread pool
+        return self.get_tuple(config)
+
+    async def aput(
+        self, config: RunnableConfig, checkpoint: Checkpoint
+    ) -> RunnableConfig:
+        return self.put(config, checkpoint)
@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 import concurrent.futures
 from collections import defaultdict, deque
+from contextlib import ExitStack
+from contextvars import copy_context
 from functools import partial
 from typing import (
     Any,
@@ -585,6 +587,10 @@ class Pregel(
             )
             # copy nodes to ignore mutations during execution
             processes = {**self.nodes}
+            # index nodes by the channels that trigger them
+            trigger_to_nodes = _trigger_to_nodes(processes)
+            # channels updated in the last step, None to check all nodes
+            updated_channels: Optional[set[str]] = None
             # get checkpoint from saver, or create an empty one
             checkpoint_config = config
             checkpoint = (
@@ -594,7 +600,11 @@ class Pregel(
             # create channels from checkpoint
             with ChannelsManager(
                 self.channels, checkpoint
-            ) as channels, get_executor_for_config(config) as executor:
+            ) as channels, ExitStack() as stack:
+                # thread pool is only started by the first step with many tasks
+                executor: Optional[concurrent.futures.Executor] = None
+                # tasks submitted to the executor in the current step
+                futures: list[concurrent.futures.Future] = []
                 # map inputs to channel updates
                 if input_writes := deque(map_input(input_keys, input)):
                     # discard any unfinished tasks from previous checkpoint
@@ -618,7 +628,15 @@ class Pregel(
                 # with channel updates applied only at the transition between steps
                 for step in range(config["recursion_limit"] + 1):
                     next_checkpoint, next_tasks = _prepare_next_tasks(
-                        checkpoint, processes, channels, for_execution=True
+                        checkpoint,
+                        processes
+                        if updated_channels is None
+                        # only nodes subscribed to updated channels can run
+                        else _triggered_processes(
+                            processes, trigger_to_nodes, updated_channels
+                        ),
+                        channels,
+                        for_execution=True,
                     )
 
                     # if no more tasks, we're done
@@ -669,21 +687,36 @@ class Pregel(
                         for name, input, proc, writes, proc_config in next_tasks
                     ]
 
-                    futures = [
-                        executor.submit(proc.invoke, input, config)
-                        for proc, input, config in tasks_w_config
-                    ]
+                    if len(tasks_w_config) == 1 and self.step_timeout is None:
+                        # a single task has nothing to run concurrently with,
+                        # so run it in this thread, skipping the executor.
+                        # failures propagate, as in _panic_or_proceed
+                        proc, input, proc_config = tasks_w_config[0]
+                        copy_context().run(proc.invoke, input, proc_config)
+                    else:
+                        if executor is None:
+                            executor = stack.enter_context(
+                                get_executor_for_config(config)
+                            )
+                            # if the run stops mid-step, cancel tasks not started yet
+                            # before shutting down the executor, as shutdown
+                            # would otherwise wait for all of them to run
+                            stack.callback(_cancel_futures, futures)
+                        futures[:] = [
+                            executor.submit(proc.invoke, input, config)
+                            for proc, input, config in tasks_w_config
+                        ]
 
-                    # execute tasks, and wait for one to fail or all to finish.
-                    # each task is independent from all other concurrent tasks
-                    done, inflight = concurrent.futures.wait(
-                        futures,
-                        return_when=concurrent.futures.FIRST_EXCEPTION,
-                        timeout=self.step_timeout,
-                    )
+                        # execute tasks, and wait for one to fail or all to finish.
+                        # each task is independent from all other concurrent tasks
+                        done, inflight = concurrent.futures.wait(
+                            futures,
+                            return_when=concurrent.futures.FIRST_EXCEPTION,
+                            timeout=self.step_timeout,
+                        )
 
-                    # panic on failure or timeout
-                    _panic_or_proceed(done, inflight, step)
+                        # panic on failure or timeout
+                        _panic_or_proceed(done, inflight, step)
 
                     # combine pending writes from all tasks
                     pending_writes = deque[tuple[str, Any]]()
@@ -691,7 +724,9 @@ class Pregel(
                         pending_writes.extend(writes)
 
                     # apply writes to channels
-                    _apply_writes(checkpoint, channels, pending_writes)
+                    updated_channels = _apply_writes(
+                        checkpoint, channels, pending_writes
+                    )
 
                     if debug:
                         print_checkpoint(step, channels)
@@ -737,13 +772,6 @@ class Pregel(
         except BaseException as e:
             run_manager.on_chain_error(e)
             raise
-        finally:
-            # cancel any pending tasks when generator is interrupted
-            try:
-                for task in futures:
-                    task.cancel()
-            except NameError:
-                pass
 
     async def astream(
         self,
@@ -792,6 +820,10 @@ class Pregel(
             )
             # copy nodes to ignore mutations during execution
             processes = {**self.nodes}
+            # index nodes by the channels that trigger them
+            trigger_to_nodes = _trigger_to_nodes(processes)
+            # channels updated in the last step, None to check all nodes
+            updated_channels: Optional[set[str]] = None
             # get checkpoint from saver, or create an empty one
             checkpoint_config = config
             checkpoint = (
@@ -825,7 +857,15 @@ class Pregel(
                 # channel updates being applied only at the transition between steps
                 for step in range(config["recursion_limit"] + 1):
                     next_checkpoint, next_tasks = _prepare_next_tasks(
-                        checkpoint, processes, channels, for_execution=True
+                        checkpoint,
+                        processes
+                        if updated_channels is None
+                        # only nodes subscribed to updated channels can run
+                        else _triggered_processes(
+                            processes, trigger_to_nodes, updated_channels
+                        ),
+                        channels,
+                        for_execution=True,
                     )
 
                     # if no more tasks, we're done
@@ -905,7 +945,9 @@ class Pregel(
                         pending_writes.extend(writes)
 
                     # apply writes to channels
-                    _apply_writes(checkpoint, channels, pending_writes)
+                    updated_channels = _apply_writes(
+                        checkpoint, channels, pending_writes
+                    )
 
                     if debug:
                         print_checkpoint(step, channels)
@@ -985,7 +1027,10 @@ class Pregel(
             debug=debug,
             **kwargs,
         ):
-            latest = {**latest, **chunk} if output_is_dict else chunk
+            if output_is_dict:
+                latest.update(chunk)
+            else:
+                latest = chunk
         return latest
 
     async def ainvoke(
@@ -1014,7 +1059,10 @@ class Pregel(
             debug=debug,
             **kwargs,
         ):
-            latest = {**latest, **chunk} if output_is_dict else chunk
+            if output_is_dict:
+                latest.update(chunk)
+            else:
+                latest = chunk
         return latest
 
 
@@ -1042,18 +1090,23 @@ def _panic_or_proceed(
         raise TimeoutError(f"Timed out at step {step}")
 
 
+def _cancel_futures(futures: Sequence[concurrent.futures.Future]) -> None:
+    for fut in futures:
+        fut.cancel()
+
+
 def _should_interrupt(
     checkpoint: Checkpoint,
     interrupt_nodes: Sequence[str],
     snapshot_channels: Sequence[str],
     tasks: list[PregelExecutableTask],
 ) -> bool:
-    # defaultdicts are mutated on access :( so we need to copy
-    seen = checkpoint["versions_seen"].copy()[INTERRUPT].copy()
+    # defaultdicts are mutated on access :( so we need to use .get()
+    seen = checkpoint["versions_seen"].get(INTERRUPT, {})
     return (
         # interrupt if any of snapshopt_channels has been updated since last interrupt
         any(
-            checkpoint["channel_versions"][chan] > seen[chan]
+            checkpoint["channel_versions"][chan] > seen.get(chan, 0)
             for chan in snapshot_channels
         )
         # and any channel written to is in interrupt_nodes list
@@ -1081,14 +1134,15 @@ def _apply_writes(
     checkpoint: Checkpoint,
     channels: Mapping[str, BaseChannel],
     pending_writes: Sequence[tuple[str, Any]],
-) -> None:
+) -> set[str]:
+    """Apply writes to channels, returning the set of channels updated."""
     pending_writes_by_channel: dict[str, list[Any]] = defaultdict(list)
     # Group writes by channel
     for chan, val in pending_writes:
         pending_writes_by_channel[chan].append(val)
 
-    # Find the highest version of all channels
-    if checkpoint["channel_versions"]:
+    # Find the highest version of all channels, only needed if any is written to
+    if pending_writes_by_channel and checkpoint["channel_versions"]:
         max_version = max(checkpoint["channel_versions"].values())
     else:
         max_version = 0
@@ -1111,6 +1165,32 @@ def _apply_writes(
     for chan in channels:
         if chan not in updated_channels:
             channels[chan].update([])
+    return updated_channels
+
+
+def _trigger_to_nodes(processes: Mapping[str, PregelNode]) -> dict[str, list[str]]:
+    """Map each channel to the names of the nodes it triggers."""
+    trigger_to_nodes: dict[str, list[str]] = defaultdict(list)
+    for name, proc in processes.items():
+        for chan in proc.triggers:
+            trigger_to_nodes[chan].append(name)
+    return trigger_to_nodes
+
+
+def _triggered_processes(
+    processes: Mapping[str, PregelNode],
+    trigger_to_nodes: Mapping[str, Sequence[str]],
+    updated_channels: set[str],
+) -> Mapping[str, PregelNode]:
+    """Select the nodes triggered by any of the updated channels, in node order.
+
+    Channels not written to in a step can only become empty, never readable,
+    so nodes not subscribed to any updated channel can't have become runnable.
+    """
+    triggered = {
+        name for chan in updated_channels for name in trigger_to_nodes.get(chan, ())
+    }
+    return {name: proc for name, proc in processes.items() if name in triggered}
 
 
 @overload
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Callable, Mapping, Optional, Sequence, Union
 
-from langchain_core.pydantic_v1 import Field
+from langchain_core.pydantic_v1 import Field, PrivateAttr
 from langchain_core.runnables import (
     Runnable,
     RunnableConfig,
@@ -111,20 +111,45 @@ class PregelNode(RunnableBindingBase):
 
     kwargs: Mapping[str, Any] = Field(default_factory=dict)
 
+    _node_cache: Optional[
+        tuple[Runnable[Any, Any], tuple[Runnable, ...], Optional[Runnable[Any, Any]]]
+    ] = PrivateAttr(default=None)
+
     def get_writers(self) -> list[Runnable]:
         """Get writers with optimizations applied."""
-        writers = self.writers.copy()
-        while (
-            len(writers) > 1
-            and isinstance(writers[-1], ChannelWrite)
-            and isinstance(writers[-2], ChannelWrite)
-        ):
-            # we can combine writes if they are consecutive
-            writers[-2].writes += writers[-1].writes
-            writers.pop()
+        writers: list[Runnable] = []
+        for writer in self.writers:
+            if (
+                writers
+                and isinstance(writer, ChannelWrite)
+                and isinstance(writers[-1], ChannelWrite)
+            ):
+                # we can combine writes if they are consecutive
+                # create a new writer, as self.writers must not be mutated
+                writers[-1] = ChannelWrite(
+                    [*writers[-1].writes, *writer.writes],
+                    tags=writers[-1].config["tags"] if writers[-1].config else None,
+                )
+            else:
+                writers.append(writer)
         return writers
 
     def get_node(self) -> Optional[Runnable[Any, Any]]:
+        # reuse the node built last time, unless bound or writers were changed
+        # since then, eg. when attaching edges to a graph
+        if (cached := self._node_cache) is not None:
+            bound, writers, node = cached
+            if (
+                bound is self.bound
+                and len(writers) == len(self.writers)
+                and all(a is b for a, b in zip(writers, self.writers))
+            ):
+                return node
+        node = self._build_node()
+        self._node_cache = (self.bound, tuple(self.writers), node)
+        return node
+
+    def _build_node(self) -> Optional[Runnable[Any, Any]]:
         writers = self.get_writers()
         if self.bound is DEFAULT_BOUND and not writers:
             return None
@@ -68,15 +68,18 @@ class ChannelWrite(RunnableCallable):
                 else r
                 if r is not None
                 else input,
+                skip_none,
             )
-            for chan, r, _ in self.writes
+            for chan, r, skip_none in self.writes
         ]
-        values = [
-            write
-            for write, (_, _, skip_none) in zip(values, self.writes)
-            if not skip_none or write[1] is not None
-        ]
-        self.do_write(config, **dict(values))
+        self.do_write(
+            config,
+            [
+                (chan, val)
+                for chan, val, skip_none in values
+                if not skip_none or val is not None
+            ],
+        )
         return input
 
     async def _awrite(self, input: Any, config: RunnableConfig) -> None:
@@ -90,18 +93,21 @@ class ChannelWrite(RunnableCallable):
                 for _, r, _ in self.writes
             )
         )
-        values = [
-            (chan, val)
-            for val, (chan, _, skip_none) in zip(values, self.writes)
-            if not skip_none or val is not None
-        ]
-        self.do_write(config, **dict(values))
+        self.do_write(
+            config,
+            [
+                (chan, val)
+                for val, (chan, _, skip_none) in zip(values, self.writes)
+                if not skip_none or val is not None
+            ],
+        )
         return input
 
     @staticmethod
-    def do_write(config: RunnableConfig, **values: Any) -> None:
+    def do_write(config: RunnableConfig, values: Sequence[tuple[str, Any]]) -> None:
+        """Send all values to their channels in a single call."""
         write: TYPE_SEND = config["configurable"][CONFIG_KEY_SEND]
-        write([(chan, val) for chan, val in values.items() if val is not SKIP_WRITE])
+        write([(chan, val) for chan, val in values if val is not SKIP_WRITE])
 
     @staticmethod
     def is_writer(runnable: Runnable) -> bool:
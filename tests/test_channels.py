@@ -6,13 +6,28 @@ import httpx
 import pytest
 from pytest_mock import MockerFixture
 
-from langgraph.channels.base import EmptyChannelError, InvalidUpdateError
+from langgraph.channels.base import BaseChannel, EmptyChannelError, InvalidUpdateError
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
 from langgraph.channels.last_value import LastValue
 from langgraph.channels.topic import Topic
 
 
+@pytest.mark.parametrize(
+    "channel",
+    [
+        LastValue(int),
+        Topic(int),
+        BinaryOperatorAggregate(int, operator.add),
+        Context(httpx.Client),
+    ],
+)
+def test_channel_has_no_instance_dict(channel: BaseChannel) -> None:
+    # channels are created for every invocation, so they use __slots__
+    with channel.from_checkpoint() as empty:
+        assert not hasattr(empty, "__dict__")
+
+
 def test_last_value() -> None:
     with LastValue(int).from_checkpoint() as channel:
         assert channel.ValueType is int
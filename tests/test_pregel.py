@@ -1,5 +1,6 @@
 import json
 import operator
+import threading
 import time
 import warnings
 from concurrent.futures import ThreadPoolExecutor
@@ -68,6 +69,29 @@ def test_invoke_single_process_in_out(mocker: MockerFixture) -> None:
     assert gapp.invoke(2, debug=True) == 3
 
 
+def test_invoke_single_task_steps_run_in_caller_thread() -> None:
+    thread_ids: list[int] = []
+
+    def add_one(x: int) -> int:
+        thread_ids.append(threading.get_ident())
+        return x + 1
+
+    one = Channel.subscribe_to("input") | add_one | Channel.write_to("inbox")
+    two = Channel.subscribe_to("inbox") | add_one | Channel.write_to("output")
+
+    app = Pregel(nodes={"one": one, "two": two})
+
+    # steps with a single task don't go through the executor
+    assert app.invoke(2) == 4
+    assert thread_ids == [threading.get_ident()] * 2
+
+    # unless a step timeout needs to be enforced
+    thread_ids.clear()
+    app.step_timeout = 1
+    assert app.invoke(2) == 4
+    assert threading.get_ident() not in thread_ids
+
+
 def test_invoke_single_process_in_out_implicit_channels(mocker: MockerFixture) -> None:
     add_one = mocker.Mock(side_effect=lambda x: x + 1)
     chain = Channel.subscribe_to("input") | add_one | Channel.write_to("output")
@@ -189,6 +213,61 @@ def test_invoke_two_processes_in_out(mocker: MockerFixture) -> None:
     assert step == 2
 
 
+def test_stream_two_processes_in_out_is_lazy(mocker: MockerFixture) -> None:
+    add_one = mocker.Mock(side_effect=lambda x: x + 1)
+    add_one_more = mocker.Mock(side_effect=lambda x: x + 1)
+    one = Channel.subscribe_to("input") | add_one | Channel.write_to("inbox")
+    two = Channel.subscribe_to("inbox") | add_one_more | Channel.write_to("output")
+
+    app = Pregel(nodes={"one": one, "two": two}, output_channels=["inbox", "output"])
+
+    stream = app.stream(2)
+    # each step is yielded as soon as it finishes, before the next step runs
+    assert next(stream) == {"inbox": 3}
+    assert add_one.call_count == 1
+    assert add_one_more.call_count == 0
+    assert next(stream) == {"output": 4}
+    assert add_one_more.call_count == 1
+    assert next(stream, None) is None
+
+
+def test_invoke_single_process_consecutive_writers(mocker: MockerFixture) -> None:
+    add_one = mocker.Mock(side_effect=lambda x: x + 1)
+    one = (
+        Channel.subscribe_to("input")
+        | add_one
+        | Channel.write_to("inbox")
+        | Channel.write_to("output")
+    )
+
+    app = Pregel(nodes={"one": one}, output_channels=["inbox", "output"])
+
+    # consecutive writers are combined into one
+    assert [[chan for chan, _, _ in writer.writes] for writer in one.get_writers()] == [
+        ["inbox", "output"]
+    ]
+
+    for _ in range(3):
+        assert app.invoke(2) == {"inbox": 3, "output": 3}
+
+    # combining writers doesn't modify the original writers
+    assert [[chan for chan, _, _ in writer.writes] for writer in one.writers] == [
+        ["inbox"],
+        ["output"],
+    ]
+
+    # the node is built once, and rebuilt only if its writers change
+    node = one.get_node()
+    assert one.get_node() is node
+    one.writers.append(Channel.write_to("other"))
+    assert one.get_node() is not node
+    assert [chan for chan, _, _ in one.get_node().last.writes] == [
+        "inbox",
+        "output",
+        "other",
+    ]
+
+
 @pytest.mark.parametrize(
     "checkpoint_at", [CheckpointAt.END_OF_RUN, CheckpointAt.END_OF_STEP]
 )
@@ -286,12 +365,11 @@ def test_invoke_two_processes_in_dict_out(mocker: MockerFixture) -> None:
 
 
 def test_batch_two_processes_in_out() -> None:
-    def add_one_with_delay(inp: int) -> int:
-        time.sleep(inp / 10)
+    def add_one(inp: int) -> int:
         return inp + 1
 
-    one = Channel.subscribe_to("input") | add_one_with_delay | Channel.write_to("one")
-    two = Channel.subscribe_to("one") | add_one_with_delay | Channel.write_to("output")
+    one = Channel.subscribe_to("input") | add_one | Channel.write_to("one")
+    two = Channel.subscribe_to("one") | add_one | Channel.write_to("output")
 
     app = Pregel(nodes={"one": one, "two": two})
 
@@ -305,8 +383,8 @@ def test_batch_two_processes_in_out() -> None:
     ]
 
     graph = Graph()
-    graph.add_node("add_one", add_one_with_delay)
-    graph.add_node("add_one_more", add_one_with_delay)
+    graph.add_node("add_one", add_one)
+    graph.add_node("add_one_more", add_one)
     graph.set_entry_point("add_one")
     graph.set_finish_point("add_one_more")
     graph.add_edge("add_one", "add_one_more")
@@ -315,9 +393,11 @@ def test_batch_two_processes_in_out() -> None:
     assert gapp.batch([3, 2, 1, 3, 5]) == [5, 4, 3, 5, 7]
 
 
-def test_invoke_many_processes_in_out(mocker: MockerFixture) -> None:
+def test_invoke_many_processes_in_out() -> None:
+    def add_one(x: int) -> int:
+        return x + 1
+
     test_size = 100
-    add_one = mocker.Mock(side_effect=lambda x: x + 1)
 
     nodes = {"-1": Channel.subscribe_to("input") | add_one | Channel.write_to("-1")}
     for i in range(test_size - 2):
@@ -328,8 +408,10 @@ def test_invoke_many_processes_in_out(mocker: MockerFixture) -> None:
 
     app = Pregel(nodes=nodes)
 
-    for _ in range(10):
-        assert app.invoke(2, {"recursion_limit": test_size}) == 2 + test_size
+    assert app.invoke(2, {"recursion_limit": test_size}) == 2 + test_size
+
+    # No state is left over from previous invocations
+    assert app.batch([2] * 10, {"recursion_limit": test_size}) == [2 + test_size] * 10
 
     with ThreadPoolExecutor() as executor:
         assert [
@@ -337,9 +419,11 @@ def test_invoke_many_processes_in_out(mocker: MockerFixture) -> None:
         ] == [2 + test_size] * 10
 
 
-def test_batch_many_processes_in_out(mocker: MockerFixture) -> None:
+def test_batch_many_processes_in_out() -> None:
+    def add_one(x: int) -> int:
+        return x + 1
+
     test_size = 100
-    add_one = mocker.Mock(side_effect=lambda x: x + 1)
 
     nodes = {"-1": Channel.subscribe_to("input") | add_one | Channel.write_to("-1")}
     for i in range(test_size - 2):
@@ -397,6 +481,48 @@ def test_invoke_two_processes_two_in_two_out_valid(mocker: MockerFixture) -> Non
     assert app.invoke(2) == [3, 3]
 
 
+def test_invoke_two_processes_two_in_two_out_interrupted(
+    mocker: MockerFixture,
+) -> None:
+    def add_one_with_delay(inp: int) -> int:
+        time.sleep(0.1)
+        return inp + 1
+
+    add_one = mocker.Mock(side_effect=add_one_with_delay)
+
+    one = Channel.subscribe_to("input") | add_one | Channel.write_to("output")
+    two = Channel.subscribe_to("input") | add_one | Channel.write_to("output")
+
+    app = Pregel(
+        nodes={"one": one, "two": two},
+        channels={"output": Topic(int)},
+    )
+
+    # stop the run while the first task is running and the second one is queued
+    mocker.patch("concurrent.futures.wait", side_effect=KeyboardInterrupt)
+    with pytest.raises(KeyboardInterrupt):
+        app.invoke(2, {"max_concurrency": 1})
+
+    # the queued task was cancelled, rather than run before shutting down
+    assert add_one.call_count == 1
+
+
+def test_invoke_single_process_two_writes_same_channel(mocker: MockerFixture) -> None:
+    add_one = mocker.Mock(side_effect=lambda x: x + 1)
+
+    one = (
+        Channel.subscribe_to("input")
+        | add_one
+        | Channel.write_to("output")
+        | Channel.write_to("output")
+    )
+
+    app = Pregel(nodes={"one": one}, channels={"output": Topic(int)})
+
+    # both writes are sent, even after being combined into a single writer
+    assert app.invoke(2) == [3, 3]
+
+
 @pytest.mark.parametrize(
     "checkpoint_at", [CheckpointAt.END_OF_RUN, CheckpointAt.END_OF_STEP]
 )
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import operator
+import time
 from contextlib import asynccontextmanager, contextmanager
 from typing import (
     Annotated,
@@ -8,13 +9,14 @@ from typing import (
     AsyncGenerator,
     AsyncIterator,
     Generator,
+    Iterator,
     Optional,
     TypedDict,
     Union,
 )
 
 import pytest
-from langchain_core.runnables import RunnableLambda, RunnablePassthrough
+from langchain_core.runnables import RunnableConfig, RunnableLambda, RunnablePassthrough
 from pytest_mock import MockerFixture
 
 from langgraph.channels.base import InvalidUpdateError
@@ -23,7 +25,8 @@ from langgraph.channels.context import Context
 from langgraph.channels.last_value import LastValue
 from langgraph.channels.topic import Topic
 from langgraph.checkpoint.aiosqlite import AsyncSqliteSaver
-from langgraph.checkpoint.base import CheckpointAt
+from langgraph.checkpoint.base import CheckpointAt, CheckpointTuple
+from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, Graph, StateGraph
 from langgraph.graph.message import MessageGraph
 from langgraph.prebuilt.chat_agent_executor import (
@@ -197,6 +200,25 @@ async def test_invoke_two_processes_in_out(mocker: MockerFixture) -> None:
     assert step == 2
 
 
+async def test_stream_two_processes_in_out_is_lazy(mocker: MockerFixture) -> None:
+    add_one = mocker.Mock(side_effect=lambda x: x + 1)
+    add_one_more = mocker.Mock(side_effect=lambda x: x + 1)
+    one = Channel.subscribe_to("input") | add_one | Channel.write_to("inbox")
+    two = Channel.subscribe_to("inbox") | add_one_more | Channel.write_to("output")
+
+    app = Pregel(nodes={"one": one, "two": two}, output_channels=["inbox", "output"])
+
+    stream = app.astream(2)
+    # each step is yielded as soon as it finishes, before the next step runs
+    assert await stream.__anext__() == {"inbox": 3}
+    assert add_one.call_count == 1
+    assert add_one_more.call_count == 0
+    assert await stream.__anext__() == {"output": 4}
+    assert add_one_more.call_count == 1
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+
+
 @pytest.mark.parametrize(
     "checkpoint_at", [CheckpointAt.END_OF_RUN, CheckpointAt.END_OF_STEP]
 )
@@ -308,7 +330,11 @@ async def test_batch_two_processes_in_out() -> None:
         channels={"one": LastValue(int)},
     )
 
+    # inputs are run concurrently, so the batch takes as long as the slowest
+    # input (1.1s), rather than the sum of all inputs (3.3s)
+    start = time.perf_counter()
     assert await app.abatch([3, 2, 1, 3, 5]) == [5, 4, 3, 5, 7]
+    assert time.perf_counter() - start < 2.5
     assert await app.abatch([3, 2, 1, 3, 5], output_keys=["output"]) == [
         {"output": 5},
         {"output": 4},
@@ -328,9 +354,11 @@ async def test_batch_two_processes_in_out() -> None:
     assert await gapp.abatch([3, 2, 1, 3, 5]) == [5, 4, 3, 5, 7]
 
 
-async def test_invoke_many_processes_in_out(mocker: MockerFixture) -> None:
+async def test_invoke_many_processes_in_out() -> None:
+    def add_one(x: int) -> int:
+        return x + 1
+
     test_size = 100
-    add_one = mocker.Mock(side_effect=lambda x: x + 1)
 
     nodes = {"-1": Channel.subscribe_to("input") | add_one | Channel.write_to("-1")}
     for i in range(test_size - 2):
@@ -341,9 +369,13 @@ async def test_invoke_many_processes_in_out(mocker: MockerFixture) -> None:
 
     app = Pregel(nodes=nodes)
 
+    assert await app.ainvoke(2, {"recursion_limit": test_size}) == 2 + test_size
+
     # No state is left over from previous invocations
-    for _ in range(10):
-        assert await app.ainvoke(2, {"recursion_limit": test_size}) == 2 + test_size
+    assert (
+        await app.abatch([2] * 10, {"recursion_limit": test_size})
+        == [2 + test_size] * 10
+    )
 
     # Concurrent invocations do not interfere with each other
     assert await asyncio.gather(
@@ -351,9 +383,11 @@ async def test_invoke_many_processes_in_out(mocker: MockerFixture) -> None:
     ) == [2 + test_size for _ in range(10)]
 
 
-async def test_batch_many_processes_in_out(mocker: MockerFixture) -> None:
+async def test_batch_many_processes_in_out() -> None:
+    def add_one(x: int) -> int:
+        return x + 1
+
     test_size = 100
-    add_one = mocker.Mock(side_effect=lambda x: x + 1)
 
     nodes = {"-1": Channel.subscribe_to("input") | add_one | Channel.write_to("-1")}
     for i in range(test_size - 2):
@@ -572,6 +606,36 @@ async def test_invoke_checkpoint_aiosqlite(
         )
 
 
+async def test_checkpoint_alist_from_sync_list(mocker: MockerFixture) -> None:
+    class ListMemorySaver(MemorySaver):
+        def list(self, config: RunnableConfig) -> Iterator[CheckpointTuple]:
+            thread_id = config["configurable"]["thread_id"]
+            for thread_ts, checkpoint in sorted(
+                self.storage[thread_id].items(), reverse=True
+            ):
+                yield CheckpointTuple(
+                    {"configurable": {"thread_id": thread_id, "thread_ts": thread_ts}},
+                    checkpoint,
+                )
+
+    add_one = mocker.Mock(side_effect=lambda x: x + 1)
+    one = Channel.subscribe_to("input") | add_one | Channel.write_to("output")
+
+    memory = ListMemorySaver()
+    app = Pregel(nodes={"one": one}, checkpointer=memory)
+
+    thread_1 = {"configurable": {"thread_id": "1"}}
+    # no checkpoints yet, default alist() ends without yielding
+    assert [c async for c in memory.alist(thread_1)] == []
+
+    assert await app.ainvoke(2, thread_1) == 3
+    assert await app.ainvoke(5, thread_1) == 6
+
+    # default alist() runs list() in a thread, yielding all checkpoints
+    thread_1_history = [c async for c in app.aget_state_history(thread_1)]
+    assert [s.values["output"] for s in thread_1_history] == [6, 3]
+
+
 async def test_invoke_two_processes_two_in_join_two_out(mocker: MockerFixture) -> None:
     add_one = mocker.Mock(side_effect=lambda x: x + 1)
     add_10_each = mocker.Mock(side_effect=lambda x: sorted(y + 10 for y in x))